@@ -1,3 +1,10 @@
-from .sdk import EkaCareSDK
-
 __all__ = ['EkaCareSDK']
+
+
+def __getattr__(name):
+    # Import the SDK (and requests) on first use so that `ekacare-cli --help`
+    # doesn't pay for them
+    if name == 'EkaCareSDK':
+        from .sdk import EkaCareSDK
+        return EkaCareSDK
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,29 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+Install the optional ``speedups`` extra (``pip install ekacare-sdk[speedups]``)
+to parse large FHIR payloads with orjson; otherwise the standard library's
+json module is used.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to JSON text, indented by two spaces if requested."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
@@ -0,0 +1,359 @@
+"""
+Eka Care Medical Records API SDK - asyncio client
+
+An aiohttp-based variant of EkaCareSDK for submitting and polling many
+documents concurrently from a single event loop.
+
+Requires the optional ``async`` extra: ``pip install ekacare-sdk[async]``
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional, Tuple
+
+import aiohttp
+
+from . import _json
+from .sdk import (
+    EkaCareSDK,
+    RETRYABLE_STATUS_CODES,
+    _PollBackoff,
+    _guess_type,
+    _is_complete,
+    _process_params,
+    _open_document,
+)
+
+
+class AsyncEkaCareSDK:
+    """
+    Async SDK for Eka Care Medical Records API
+
+    Use as an async context manager; authentication happens on entry.
+
+    Args:
+        client_id (str): The client ID for authentication
+        client_secret (str): The client secret for authentication
+        base_url (str): The base URL for the API (default: https://api.eka.care)
+        max_connections (int): Maximum concurrent HTTP connections (default: 32)
+
+    Example:
+        >>> async with AsyncEkaCareSDK("your_client_id", "your_client_secret") as sdk:
+        >>>     results = await sdk.process_many(["a.jpg", "b.jpg"])
+    """
+
+    AUTH_ENDPOINT = EkaCareSDK.AUTH_ENDPOINT
+    PROCESS_ENDPOINT = EkaCareSDK.PROCESS_ENDPOINT
+    RESULT_ENDPOINT = EkaCareSDK.RESULT_ENDPOINT
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        base_url: str = "https://api.eka.care",
+        max_connections: int = 32
+    ):
+        """Initialize the SDK with client credentials."""
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.base_url = base_url.rstrip('/')
+        self.max_connections = max_connections
+
+        # Endpoint URLs, built once rather than on every request
+        self._auth_url = self.base_url + self.AUTH_ENDPOINT
+        self._process_url = self.base_url + self.PROCESS_ENDPOINT
+        self._result_url_tmpl = (self.base_url + self.RESULT_ENDPOINT).replace(
+            "{document_id}", "{}"
+        )
+        self._bearer_token: Optional[str] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _authenticate(self) -> None:
+        """
+        Get access token from the authentication API.
+
+        Raises:
+            Exception: If authentication fails
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+
+        url = self._auth_url
+        payload = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret
+        }
+
+        try:
+            async with self._session.post(url, json=payload) as response:
+                response.raise_for_status()
+                data = await response.json(loads=_json.loads)
+            self._bearer_token = data["access_token"]
+
+            # Set authorization header for future requests
+            self._session.headers.update({
+                "Authorization": f"Bearer {self._bearer_token}"
+            })
+
+        except (aiohttp.ClientError, ValueError) as e:
+            raise Exception(f"Authentication failed: {str(e)}") from e
+        except KeyError:
+            raise Exception("Access token not found in authentication response")
+
+    async def process_document(
+        self,
+        file_path: str,
+        doc_type: Literal["lr"] = "lr",
+        task: Literal["smart", "pii", "both"] = "smart"
+    ) -> Dict[str, Any]:
+        """
+        Process a medical document using the Eka Care API.
+
+        Args:
+            file_path (str): Path to the file to upload
+            doc_type (str): Document type (default: "lr" for lab report)
+            task (str): Processing task - one of "smart", "pii", or "both" (default: "smart")
+
+        Returns:
+            dict: The API response containing document_id and status
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+            ValueError: If task parameter is invalid
+            aiohttp.ClientError: If the API request fails
+        """
+        url = self._process_url
+
+        # Build params (this also validates the task)
+        params = _process_params(doc_type, task)
+
+        # Opening the file doubles as the existence check
+        file_path_obj = Path(file_path)
+        content_type = _guess_type(file_path_obj.suffix.lower())
+
+        with _open_document(file_path) as file:
+            form = aiohttp.FormData()
+            form.add_field(
+                "file",
+                file,
+                filename=file_path_obj.name,
+                content_type=content_type
+            )
+
+            async with self._session.post(url, data=form, params=params) as response:
+                response.raise_for_status()
+                return await response.json(loads=_json.loads)
+
+    async def get_document_result(self, document_id: str) -> Dict[str, Any]:
+        """
+        Retrieve the processing result for a previously submitted document.
+
+        Args:
+            document_id (str): The unique document ID returned from process_document
+
+        Returns:
+            dict: The processing result containing status, data, fhir, and output
+
+        Raises:
+            aiohttp.ClientError: If the API request fails
+        """
+        url = self._result_url_tmpl.format(document_id)
+
+        async with self._session.get(url) as response:
+            response.raise_for_status()
+            return await response.json(loads=_json.loads)
+
+    async def process_and_wait(
+        self,
+        file_path: str,
+        task: Literal["smart", "pii", "both"] = "smart",
+        poll_interval: int = 10,
+        timeout: int = 300
+    ) -> Dict[str, Any]:
+        """
+        Process a document and wait for completion.
+
+        Polling backs off exponentially exactly like EkaCareSDK.process_and_wait,
+        but waits with asyncio.sleep so other documents make progress meanwhile.
+
+        Args:
+            file_path (str): Path to the file to upload
+            task (str): Processing task - one of "smart", "pii", or "both"
+            poll_interval (int): Base seconds between polling attempts (default: 10)
+            timeout (int): Maximum seconds to wait for completion (default: 300)
+
+        Returns:
+            dict: The completed processing result
+
+        Raises:
+            TimeoutError: If processing doesn't complete within timeout
+            FileNotFoundError: If the file doesn't exist
+            aiohttp.ClientError: If any API request fails
+        """
+        # Submit document
+        submit_result = await self.process_document(file_path, task=task)
+        document_id = submit_result["document_id"]
+
+        return await self._poll_until_done(document_id, poll_interval, timeout)
+
+    async def _poll_until_done(
+        self,
+        document_id: str,
+        poll_interval: float,
+        timeout: float
+    ) -> Dict[str, Any]:
+        """Poll a submitted document with backoff until it completes."""
+        loop = asyncio.get_running_loop()
+        backoff = _PollBackoff(poll_interval)
+        start_time = loop.time()
+        while True:
+            # Check timeout
+            elapsed = loop.time() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(
+                    f"Document processing timed out after {timeout} seconds"
+                )
+
+            try:
+                result = await self.get_document_result(document_id)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUS_CODES:
+                    raise
+                backoff.throttle(e.headers.get("Retry-After") if e.headers else None)
+                await asyncio.sleep(min(backoff.next_sleep(), max(timeout - elapsed, 0)))
+                continue
+
+            # Check if processing is complete
+            if _is_complete(result):
+                return result
+
+            # Check if processing failed
+            if result.get("status") == "failed":
+                raise Exception("Document processing failed")
+
+            # Wait before next poll, without overshooting the timeout
+            await asyncio.sleep(min(backoff.next_sleep(), max(timeout - elapsed, 0)))
+
+    async def process_many(
+        self,
+        file_paths: Iterable[str],
+        task: Literal["smart", "pii", "both"] = "smart",
+        poll_interval: int = 10,
+        timeout: int = 300
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several documents concurrently and wait for all of them.
+
+        Args:
+            file_paths: Paths of the files to upload
+            task (str): Processing task - one of "smart", "pii", or "both"
+            poll_interval (int): Base seconds between polling attempts (default: 10)
+            timeout (int): Maximum seconds to wait for each document (default: 300)
+
+        Returns:
+            list: The completed processing results, in the order of file_paths
+
+        Example:
+            >>> results = await sdk.process_many(["a.jpg", "b.jpg"], task="smart")
+        """
+        return await asyncio.gather(*[
+            self.process_and_wait(
+                file_path,
+                task=task,
+                poll_interval=poll_interval,
+                timeout=timeout
+            )
+            for file_path in file_paths
+        ])
+
+    async def process_documents(
+        self,
+        file_paths: Iterable[str],
+        task: Literal["smart", "pii", "both"] = "smart",
+        poll_interval: int = 10,
+        timeout: int = 300
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Process several documents and yield each result as it completes.
+
+        Every document is polled by its own task; the generator wakes up
+        via asyncio.wait(FIRST_COMPLETED) exactly when a result is ready.
+
+        If some uploads fail, the documents that were accepted are still
+        polled and yielded; the first failed upload's exception (in
+        file_paths order) is raised only after that.
+
+        Args:
+            file_paths: Paths of the files to upload
+            task (str): Processing task - one of "smart", "pii", or "both"
+            poll_interval (int): Base seconds between polling attempts (default: 10)
+            timeout (int): Maximum seconds to wait for each document (default: 300)
+
+        Yields:
+            tuple: (file_path, result) for each completed document, in
+            completion order
+
+        Example:
+            >>> async for path, result in sdk.process_documents(["a.jpg", "b.jpg"]):
+            >>>     print(path, result["data"]["output"])
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+
+        # Submit all documents, keeping the ones accepted even if others fail
+        submit_results = await asyncio.gather(*[
+            self.process_document(file_path, task=task)
+            for file_path in file_paths
+        ], return_exceptions=True)
+        upload_errors = [
+            submit_result for submit_result in submit_results
+            if isinstance(submit_result, BaseException)
+        ]
+
+        # One polling task per accepted document
+        tasks = {
+            asyncio.create_task(
+                self._poll_until_done(submit_result["document_id"], poll_interval, timeout)
+            ): file_path
+            for file_path, submit_result in zip(file_paths, submit_results)
+            if not isinstance(submit_result, BaseException)
+        }
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task_done in done:
+                    yield tasks[task_done], task_done.result()
+        finally:
+            for task_pending in tasks:
+                task_pending.cancel()
+
+        # Only now report uploads that failed
+        if upload_errors:
+            raise upload_errors[0]
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Async context manager entry; authenticates."""
+        try:
+            await self._authenticate()
+        except Exception:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
+__all__ = ["AsyncEkaCareSDK"]
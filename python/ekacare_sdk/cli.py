@@ -4,17 +4,35 @@ Command-line interface for Eka Care SDK.
 
 Usage:
     ekacare-cli --client-id YOUR_ID --client-secret YOUR_SECRET --file /path/to/file.jpg
+    ekacare-cli --file a.jpg --file b.pdf --parallel 8
     ekacare-cli --help
 """
 
 import argparse
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
-from .sdk import EkaCareSDK
-from .config import EkaCareConfig
+# Minimum seconds between polls when output isn't going to a terminal
+NON_TTY_POLL_INTERVAL = 30
+
+# The SDK (and requests, and orjson if installed) are imported only once
+# arguments are parsed, so --help and usage errors return without paying
+# for them.
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -37,6 +55,9 @@ Examples:
   
   # Process and don't wait for results
   %(prog)s --file document.jpg --no-wait
+  
+  # Process several documents, uploading up to 8 at a time
+  %(prog)s --file a.jpg --file b.jpg --file c.pdf --parallel 8
         """
     )
     
@@ -61,7 +82,15 @@ Examples:
     doc_group.add_argument(
         "-f", "--file",
         type=Path,
-        help="Path to the file to process"
+        action="append",
+        help="Path to the file to process (repeat to process several files)"
+    )
+    doc_group.add_argument(
+        "--parallel",
+        type=_positive_int,
+        default=4,
+        metavar="N",
+        help="Maximum files to upload at once when processing several (default: 4)"
     )
     doc_group.add_argument(
         "-t", "--task",
@@ -86,7 +115,9 @@ Examples:
         "--poll-interval",
         type=int,
         default=10,
-        help="Seconds between polling attempts (default: 10)"
+        help="Base seconds between polling attempts; polling backs off "
+             "exponentially up to 3x this value (default: 10, raised to at "
+             "least 30 when output is not a terminal)"
     )
     poll_group.add_argument(
         "--timeout",
@@ -118,9 +149,10 @@ Examples:
 
 def print_result(result: dict, verbose: bool = False, as_json: bool = False) -> None:
     """Print processing result."""
+    from ._json import dumps
+    
     if as_json:
-        import json
-        print(json.dumps(result, indent=2))
+        print(dumps(result, indent=True))
         return
     
     data = result.get("data", {})
@@ -134,13 +166,12 @@ def print_result(result: dict, verbose: bool = False, as_json: bool = False) ->
         if data.get("fhir"):
             print("\nFHIR Data:")
             print("-" * 60)
-            import json
-            print(json.dumps(data["fhir"], indent=2))
+            print(dumps(data["fhir"], indent=True))
         
         if data.get("output"):
             print("\nOutput Data:")
             print("-" * 60)
-            print(json.dumps(data["output"], indent=2))
+            print(dumps(data["output"], indent=True))
     else:
         print(f"\n✓ Processing completed successfully!")
         if data.get("fhir"):
@@ -149,17 +180,153 @@ def print_result(result: dict, verbose: bool = False, as_json: bool = False) ->
             print(f"  Output data available: Yes")
 
 
+def _set_resume_handler(handler):
+    """Install a SIGCONT handler where supported; return the previous handler."""
+    if not hasattr(signal, "SIGCONT"):
+        return None
+    try:
+        return signal.signal(signal.SIGCONT, handler)
+    except ValueError:
+        # Signal handlers can only be installed from the main thread
+        return None
+
+
+class _Resumed(Exception):
+    """Raised by the SIGCONT handler to cut a polling sleep short."""
+
+
+class _ResumableSleep:
+    """
+    time.sleep() that a SIGCONT handler can end early.
+    
+    Signal handlers run between bytecodes of the main thread, so the
+    handler must not take locks (threading.Event.set() can deadlock if the
+    signal lands while the Event's own lock is held). Instead it raises
+    _Resumed, and only while a sleep is in progress; the flag is cleared
+    by the handler itself so a second signal can't escape the except block.
+    """
+    
+    def __init__(self, on_resume):
+        self._on_resume = on_resume
+        self._sleeping = False
+    
+    def handle_signal(self, signum, frame) -> None:
+        self._on_resume()
+        if self._sleeping:
+            self._sleeping = False
+            raise _Resumed()
+    
+    def __call__(self, seconds: float) -> None:
+        try:
+            self._sleeping = True
+            time.sleep(seconds)
+            self._sleeping = False
+        except _Resumed:
+            pass
+
+
+def _process_files(sdk, args: argparse.Namespace, progress: TextIO) -> int:
+    """
+    Process several files with one SDK instance, uploading them concurrently.
+    
+    main() has already checked that every file exists. Each document ID is
+    printed as soon as its upload finishes, so a later failure or timeout
+    never loses track of documents already submitted. Results that did
+    finish are still printed (or included in the JSON) when others fail.
+    Progress lines go to progress, which is stderr when stdout carries JSON.
+    """
+    from ._json import dumps
+    
+    # A file given twice is only uploaded once
+    file_paths = list(dict.fromkeys(str(file_path) for file_path in args.file))
+    
+    if not args.quiet and not args.no_wait:
+        print(f"Processing {len(file_paths)} documents...", file=progress)
+    
+    # Submit all documents, reporting each ID as soon as it's known
+    document_ids = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+        futures = {
+            executor.submit(
+                sdk.process_document, file_path, doc_type=args.doc_type, task=args.task
+            ): file_path
+            for file_path in file_paths
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                document_ids[file_path] = future.result()["document_id"]
+            except Exception as e:
+                errors[file_path] = f"Upload failed: {e}"
+                print(f"Error: {file_path}: {errors[file_path]}", file=sys.stderr)
+                continue
+            if args.no_wait and not args.json:
+                print(f"{file_path}: {document_ids[file_path]}")
+            elif not args.quiet:
+                print(f"{file_path}: {document_ids[file_path]}", file=progress)
+    
+    results = {}
+    if not args.no_wait and document_ids:
+        file_paths_by_id = {
+            document_id: file_path for file_path, document_id in document_ids.items()
+        }
+        try:
+            for document_id, result in sdk._poll_documents(
+                file_paths_by_id, args.poll_interval, args.timeout
+            ):
+                file_path = file_paths_by_id[document_id]
+                if result.get("status") == "failed":
+                    errors[file_path] = "Document processing failed"
+                    print(f"Error: {file_path}: {errors[file_path]}", file=sys.stderr)
+                    continue
+                results[file_path] = result
+                if not args.json:
+                    print(f"\n{file_path}:", end="")
+                    print_result(result, verbose=args.verbose)
+        except Exception as e:
+            # Timed out or the API gave up: report what's left unfinished
+            for file_path in document_ids:
+                if file_path not in results and file_path not in errors:
+                    errors[file_path] = str(e)
+            print(f"\nError: {e}", file=sys.stderr)
+    
+    if args.json:
+        entries = []
+        for file_path in file_paths:
+            entry = {"file": file_path}
+            if file_path in document_ids:
+                entry["document_id"] = document_ids[file_path]
+            if file_path in results:
+                entry["result"] = results[file_path]
+            if file_path in errors:
+                entry["error"] = errors[file_path]
+            entries.append(entry)
+        print(dumps(entries, indent=True))
+    return 1 if errors else 0
+
+
 def main(argv: Optional[list] = None) -> int:
     """Main CLI entry point."""
     parser = create_parser()
     args = parser.parse_args(argv)
     
+    # Nobody is watching a pipe or log file: poll less often and skip the
+    # progress dots
+    interactive = sys.stdout.isatty()
+    if not interactive:
+        args.poll_interval = max(args.poll_interval, NON_TTY_POLL_INTERVAL)
+    
+    # Progress goes to stderr when stdout carries JSON
+    progress = sys.stderr if args.json else sys.stdout
+    
     # Get credentials from args or environment
     try:
         if args.client_id and args.client_secret:
             client_id = args.client_id
             client_secret = args.client_secret
         else:
+            from .config import EkaCareConfig
             config = EkaCareConfig.from_env(base_url=args.base_url)
             client_id = config.client_id
             client_secret = config.client_secret
@@ -177,27 +344,40 @@ def main(argv: Optional[list] = None) -> int:
         parser.print_help()
         return 1
     
-    # Validate file exists
-    if not args.file.exists():
-        print(f"Error: File not found: {args.file}", file=sys.stderr)
+    # Check every file up front, before logging in or uploading anything
+    missing = [file_path for file_path in args.file if not file_path.is_file()]
+    if missing:
+        for file_path in missing:
+            print(f"Error: File not found: {file_path}", file=sys.stderr)
         return 1
     
+    import requests
+    from ._json import dumps
+    from .sdk import EkaCareSDK, _PollBackoff, _is_complete, _is_retryable
+    
+    sdk = None
+    previous_handler = None
     try:
         # Initialize SDK
         if not args.quiet:
-            print("Authenticating...", end=" ", flush=True)
+            print("Authenticating...", end=" ", flush=True, file=progress)
         
         sdk = EkaCareSDK(client_id, client_secret, args.base_url)
         
         if not args.quiet:
-            print("✓")
+            print("✓", file=progress)
+        
+        # Several files: submit concurrently and poll them together
+        if len(args.file) > 1:
+            return _process_files(sdk, args, progress)
+        file_path = args.file[0]
         
         # Process document
         if not args.quiet:
-            print(f"Processing document: {args.file.name}...", end=" ", flush=True)
+            print(f"Processing document: {file_path.name}...", end=" ", flush=True, file=progress)
         
         result = sdk.process_document(
-            str(args.file),
+            str(file_path),
             doc_type=args.doc_type,
             task=args.task
         )
@@ -205,13 +385,19 @@ def main(argv: Optional[list] = None) -> int:
         document_id = result["document_id"]
         
         if not args.quiet:
-            print("✓")
-            print(f"Document ID: {document_id}")
+            print("✓", file=progress)
+            print(f"Document ID: {document_id}", file=progress)
         
         # Wait for results if requested
         if not args.no_wait:
             if not args.quiet:
-                print("\nWaiting for processing to complete", end="", flush=True)
+                print("\nWaiting for processing to complete", end="", flush=True, file=progress)
+            
+            backoff = _PollBackoff(args.poll_interval)
+            
+            # Poll again promptly when resumed after being stopped (Ctrl-Z/fg)
+            wait = _ResumableSleep(backoff.reset)
+            previous_handler = _set_resume_handler(wait.handle_signal)
             
             start_time = time.time()
             while True:
@@ -220,15 +406,22 @@ def main(argv: Optional[list] = None) -> int:
                 if elapsed > args.timeout:
                     print(f"\n\nError: Processing timed out after {args.timeout} seconds", file=sys.stderr)
                     return 1
+                remaining = max(args.timeout - elapsed, 0)
                 
-                # Get result
-                result = sdk.get_document_result(document_id)
-                data = result.get("data", {})
+                # Get result, backing off further on 429/5xx
+                try:
+                    result = sdk._get_result(document_id)
+                except requests.exceptions.HTTPError as e:
+                    if not _is_retryable(e):
+                        raise
+                    backoff.throttle(e.response.headers.get("Retry-After"))
+                    wait(min(backoff.next_sleep(), remaining))
+                    continue
                 
                 # Check if complete
-                if data.get("fhir") and data.get("output"):
+                if _is_complete(result):
                     if not args.quiet:
-                        print()  # New line after dots
+                        print(file=progress)  # New line after dots
                     print_result(result, verbose=args.verbose, as_json=args.json)
                     break
                 
@@ -238,14 +431,13 @@ def main(argv: Optional[list] = None) -> int:
                     return 1
                 
                 # Wait and show progress
-                if not args.quiet:
-                    print(".", end="", flush=True)
-                time.sleep(args.poll_interval)
+                if interactive and not args.quiet:
+                    print(".", end="", flush=True, file=progress)
+                wait(min(backoff.next_sleep(), remaining))
         else:
             # Just print document ID
             if args.json:
-                import json
-                print(json.dumps({"document_id": document_id}, indent=2))
+                print(dumps({"document_id": document_id}, indent=True))
             else:
                 print(f"\nDocument submitted. Use document ID to check status: {document_id}")
         
@@ -261,7 +453,11 @@ def main(argv: Optional[list] = None) -> int:
             traceback.print_exc()
         return 1
     finally:
-        sdk.close()
+        if previous_handler is not None:
+            signal.signal(signal.SIGCONT, previous_handler)
+        # sdk is still None if authentication failed
+        if sdk is not None:
+            sdk.close()
 
 
 if __name__ == "__main__":
@@ -4,11 +4,225 @@ Eka Care Medical Records API SDK
 A Python SDK for interacting with the Eka Care API for document processing.
 """
 
-import mimetypes
+import copy
+import functools
+import hashlib
+import json
+import os
+import random
 import requests
+import threading
 import time
-from typing import Optional, Literal, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from typing import Optional, Literal, Dict, Any, Callable, Iterable, Iterator, List, Mapping, Tuple
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from . import _json
+
+
+# Polling backoff: start at BACKOFF_INITIAL_DELAY seconds, grow by
+# BACKOFF_FACTOR after each poll, and cap at poll_interval * BACKOFF_CEILING.
+BACKOFF_INITIAL_DELAY = 1.0
+BACKOFF_FACTOR = 1.7
+BACKOFF_CEILING = 3
+BACKOFF_JITTER = 0.25
+
+# Keep-alive connection pool size per host, sized for concurrent polling/uploads
+POOL_MAXSIZE = 20
+
+# Automatic retries for connection errors and transient 429/5xx responses,
+# sleeping RETRY_BACKOFF_FACTOR * 2**n seconds (or Retry-After) in between
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+
+# Statuses that are safe to re-send a request on: the server (or a proxy in
+# front of it) rejected it without acting on it. A 500 is left out, because
+# an upload can fail with 500 after the document was created.
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Status codes that mean "slow down" rather than "give up" while polling;
+# re-fetching a result is harmless, so this includes 500
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Content types of the document formats the API accepts, by file suffix
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+}
+
+# Cached bearer tokens are reused until this many seconds before expiry
+TOKEN_EXPIRY_MARGIN = 60
+
+# Most in-progress results kept for If-None-Match revalidation
+ETAG_CACHE_SIZE = 256
+
+# Largest completion-callback body the callback server will read
+MAX_CALLBACK_BODY = 64 * 1024
+
+
+class _PollBackoff:
+    """
+    Exponential backoff with jitter for result polling.
+    
+    Args:
+        poll_interval (float): Base polling interval; the delay is capped at
+            poll_interval * BACKOFF_CEILING
+    """
+    
+    def __init__(self, poll_interval: float):
+        self.initial_delay = min(BACKOFF_INITIAL_DELAY, poll_interval)
+        self.max_delay = max(poll_interval * BACKOFF_CEILING, self.initial_delay)
+        self.delay = self.initial_delay
+    
+    def next_sleep(self) -> float:
+        """Return how long to sleep before the next poll and grow the delay."""
+        delay = self.delay
+        self.delay = min(delay * BACKOFF_FACTOR, self.max_delay)
+        return delay + random.uniform(0, BACKOFF_JITTER * delay)
+    
+    def throttle(self, retry_after: Optional[str] = None) -> None:
+        """Back off further after a 429/5xx, honouring Retry-After if present."""
+        try:
+            self.delay = max(float(retry_after), self.initial_delay)
+        except (TypeError, ValueError):
+            self.delay = self.max_delay
+    
+    def reset(self) -> None:
+        """Start over from the initial delay."""
+        self.delay = self.initial_delay
+
+
+def _guess_type(suffix: str) -> str:
+    """Content type for a lower-cased file suffix such as ".pdf"."""
+    return CONTENT_TYPES.get(suffix, "application/octet-stream")
+
+
+@functools.lru_cache(maxsize=None)
+def _process_params(doc_type: str, task: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Query parameters for the process endpoint.
+    
+    Raises:
+        ValueError: If task parameter is invalid
+    """
+    # Validate task parameter
+    valid_tasks = ["smart", "pii", "both"]
+    if task not in valid_tasks:
+        raise ValueError(f"Invalid task. Must be one of: {', '.join(valid_tasks)}")
+    
+    # Handle 'both' case with multiple task parameters
+    if task == "both":
+        return (("dt", doc_type), ("task", "smart"), ("task", "pii"))
+    return (("dt", doc_type), ("task", task))
+
+
+def _open_document(file_path: str):
+    """Open a document for upload, raising FileNotFoundError if it's missing."""
+    try:
+        return open(file_path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+
+def _retry_policy() -> Retry:
+    """Retry policy for transient connection errors and 429/5xx responses."""
+    return Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        # Hand the last response back so callers still see an HTTPError
+        raise_on_status=False
+    )
+
+
+def _connect_retry_policy() -> Retry:
+    """Retry policy that only re-tries failed connections."""
+    return Retry(
+        total=RETRY_TOTAL,
+        read=0,
+        status=0,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+
+
+def _token_cache_path(client_id: str, base_url: str) -> Path:
+    """Location of the cached bearer token for a client and API host."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha256(f"{base_url}|{client_id}".encode()).hexdigest()[:16]
+    return Path(cache_home) / "ekacare" / f"token-{key}.json"
+
+
+def _load_cached_token(path: Path) -> Optional[str]:
+    """Return the cached access token if it is not about to expire."""
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        if cached["expires_at"] - time.time() > TOKEN_EXPIRY_MARGIN:
+            return cached["access_token"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _store_cached_token(path: Path, access_token: str, expires_in: float) -> None:
+    """Write a token to the cache, readable only by the current user."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "access_token": access_token,
+                "expires_at": time.time() + expires_in
+            }, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is best-effort; the SDK works without it
+        pass
+
+
+# Shared stand-in for a missing "data" object, so checking an in-progress
+# result doesn't allocate a new empty dict on every poll
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _is_complete(result: Dict[str, Any]) -> bool:
+    """Check whether a result carries both the FHIR and output payloads."""
+    data = result.get("data") or _EMPTY
+    return bool(data.get("fhir") and data.get("output"))
+
+
+def _is_retryable(error: requests.exceptions.HTTPError) -> bool:
+    """Check whether a polling error is a transient 429/5xx response."""
+    return (
+        error.response is not None
+        and error.response.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Parse a response body, raising a RequestException if it isn't JSON."""
+    try:
+        return _json.loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in response from {response.url}: {e}",
+            response=response
+        ) from e
 
 
 class EkaCareSDK:
@@ -22,6 +236,11 @@ class EkaCareSDK:
         client_id (str): The client ID for authentication
         client_secret (str): The client secret for authentication
         base_url (str): The base URL for the API (default: https://api.eka.care)
+        timeout (float): Seconds to wait for the server on each request (default: 30)
+        cache_token (bool): Reuse the bearer token across SDK instances via
+            ~/.cache/ekacare until shortly before it expires (default: True)
+        bulk_results (bool): Have get_document_results() try the bulk
+            results endpoint before polling documents one by one (default: False)
         
     Example:
         >>> sdk = EkaCareSDK("your_client_id", "your_client_secret")
@@ -32,31 +251,84 @@ class EkaCareSDK:
     AUTH_ENDPOINT = "/connect-auth/v1/account/login"
     PROCESS_ENDPOINT = "/mr/api/v2/docs"
     RESULT_ENDPOINT = "/mr/api/v1/docs/{document_id}/result"
+    RESULTS_ENDPOINT = "/mr/api/v1/docs/results"
     
     def __init__(
         self, 
         client_id: str, 
         client_secret: str, 
-        base_url: str = "https://api.eka.care"
+        base_url: str = "https://api.eka.care",
+        timeout: float = 30.0,
+        cache_token: bool = True,
+        bulk_results: bool = False
     ):
         """Initialize the SDK with client credentials."""
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        
+        # Endpoint URLs, built once rather than on every request
+        self._auth_url = self.base_url + self.AUTH_ENDPOINT
+        self._process_url = self.base_url + self.PROCESS_ENDPOINT
+        self._result_url_tmpl = (self.base_url + self.RESULT_ENDPOINT).replace(
+            "{document_id}", "{}"
+        )
+        self._results_url = self.base_url + self.RESULTS_ENDPOINT
         self._bearer_token: Optional[str] = None
+        self._token_cache_path = (
+            _token_cache_path(client_id, self.base_url) if cache_token else None
+        )
+        
+        # One keep-alive pool shared by auth, uploads and polling, large
+        # enough that concurrent requests don't open throwaway connections.
+        # urllib3 itself only retries failed connects: it can't rewind a
+        # streamed upload body, and the polling loops back off on 429/5xx
+        # within their own deadline. _send() re-sends everything else on
+        # 429/5xx with _resend_retry.
         self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_MAXSIZE,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=_connect_retry_policy()
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._resend_retry = _retry_policy()
+        
+        # Completion events for documents submitted with a callback_url,
+        # set by the server started with serve_callbacks()
+        self._callback_events: Dict[str, threading.Event] = {}
+        self._callback_lock = threading.Lock()
+        self._callback_server: Optional[ThreadingHTTPServer] = None
+        
+        # ETag and body of the last in-progress result seen per document,
+        # so repeated polls can be answered with 304 Not Modified
+        self._result_etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        
+        # Opt-in; set to False once the API rejects the bulk results endpoint
+        self._bulk_results_supported = bulk_results
         
         # Authenticate and get token
         self._authenticate()
     
-    def _authenticate(self) -> None:
+    def _authenticate(self, force: bool = False) -> None:
         """
-        Get access token from the authentication API.
+        Get access token from the token cache or the authentication API.
+        
+        Args:
+            force (bool): Skip the token cache and always request a new token
         
         Raises:
             requests.exceptions.RequestException: If authentication fails
         """
-        url = f"{self.base_url}{self.AUTH_ENDPOINT}"
+        if not force and self._token_cache_path is not None:
+            cached_token = _load_cached_token(self._token_cache_path)
+            if cached_token:
+                self._set_bearer_token(cached_token)
+                return
+        
+        url = self._auth_url
         payload = {
             "client_id": self.client_id,
             "client_secret": self.client_secret
@@ -64,27 +336,82 @@ class EkaCareSDK:
         headers = {"Content-Type": "application/json"}
         
         try:
-            response = self._session.post(url, json=payload, headers=headers)
-            response.raise_for_status()
+            response = self._send(
+                lambda: self._session.post(
+                    url, json=payload, headers=headers, timeout=self.timeout
+                ),
+                retry=self._resend_retry,
+                reauthenticate=False
+            )
             
-            data = response.json()
-            self._bearer_token = data["access_token"]
-            
-            # Set authorization header for future requests
-            self._session.headers.update({
-                "Authorization": f"Bearer {self._bearer_token}"
-            })
+            data = _parse_json(response)
+            self._set_bearer_token(data["access_token"])
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Authentication failed: {str(e)}") from e
-        except KeyError:
+        except (KeyError, TypeError):
             raise Exception("Access token not found in authentication response")
+        
+        # Only tokens with a known lifetime can be safely reused later
+        if self._token_cache_path is not None and data.get("expires_in"):
+            _store_cached_token(
+                self._token_cache_path, self._bearer_token, float(data["expires_in"])
+            )
+    
+    def _set_bearer_token(self, token: str) -> None:
+        """Use a bearer token for all future requests."""
+        self._bearer_token = token
+        self._session.headers.update({
+            "Authorization": f"Bearer {self._bearer_token}"
+        })
+    
+    def _send(
+        self,
+        send: Callable[[], requests.Response],
+        retry: Optional[Retry] = None,
+        reauthenticate: bool = True
+    ) -> requests.Response:
+        """
+        Send a request, re-authenticating and retrying once on 401.
+        
+        Args:
+            send: Callable that issues the request; called again for the retry,
+                so it must rebuild any streamed body
+            retry: Policy for re-sending on 429/5xx (default: don't re-send)
+            reauthenticate: Whether a 401 triggers a new login and one retry
+        
+        Raises:
+            requests.exceptions.HTTPError: If the API returns an error status
+        """
+        response = send()
+        while retry is not None and retry.is_retry(
+            response.request.method,
+            response.status_code,
+            "Retry-After" in response.headers
+        ):
+            try:
+                retry = retry.increment(
+                    response.request.method, response.url, response=response.raw
+                )
+            except MaxRetryError:
+                break
+            retry.sleep(response.raw)
+            response.close()
+            response = send()
+        
+        if reauthenticate and response.status_code == 401:
+            response.close()
+            self._authenticate(force=True)
+            response = send()
+        response.raise_for_status()
+        return response
     
     def process_document(
         self,
         file_path: str,
         doc_type: Literal["lr"] = "lr",
-        task: Literal["smart", "pii", "both"] = "smart"
+        task: Literal["smart", "pii", "both"] = "smart",
+        callback_url: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a medical document using the Eka Care API.
@@ -93,6 +420,8 @@ class EkaCareSDK:
             file_path (str): Path to the file to upload
             doc_type (str): Document type (default: "lr" for lab report)
             task (str): Processing task - one of "smart", "pii", or "both" (default: "smart")
+            callback_url (str, optional): URL the API should notify when
+                processing finishes (see serve_callbacks)
         
         Returns:
             dict: The API response containing document_id and status
@@ -106,49 +435,48 @@ class EkaCareSDK:
             >>> result = sdk.process_document("/path/to/lab_report.jpg", task="smart")
             >>> print(f"Document ID: {result['document_id']}")
         """
-        # Validate file exists
+        url = self._process_url
+        
+        # Build params (this also validates the task)
+        params = _process_params(doc_type, task)
+        if callback_url:
+            params += (("callback_url", callback_url),)
+        
+        # Prepare the file for upload; opening it doubles as the existence check
         file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        
-        # Validate task parameter
-        valid_tasks = ["smart", "pii", "both"]
-        if task not in valid_tasks:
-            raise ValueError(f"Invalid task. Must be one of: {', '.join(valid_tasks)}")
-        
-        # Prepare the API endpoint
-        url = f"{self.base_url}{self.PROCESS_ENDPOINT}"
-        
-        # Build params - handle 'both' case with multiple task parameters
-        params = [("dt", doc_type)]
-        if task == "both":
-            params.append(("task", "smart"))
-            params.append(("task", "pii"))
-        else:
-            params.append(("task", task))
-        
-        # Prepare the file for upload
-        content_type, _ = mimetypes.guess_type(file_path)
-        
-        with open(file_path, "rb") as file:
-            files = {
-                "file": (
-                    file_path_obj.name, 
-                    file, 
-                    content_type or "application/octet-stream"
+        content_type = _guess_type(file_path_obj.suffix.lower())
+        
+        with _open_document(file_path) as file:
+            def upload() -> requests.Response:
+                # Stream the multipart body from disk instead of buffering
+                # the whole file in memory
+                file.seek(0)
+                encoder = MultipartEncoder(fields={
+                    "file": (file_path_obj.name, file, content_type)
+                })
+                
+                return self._session.post(
+                    url,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    params=params,
+                    timeout=self.timeout
                 )
-            }
             
             # Make the API request
-            response = self._session.post(url, files=files, params=params)
-            response.raise_for_status()
-            
-            return response.json()
+            response = self._send(upload, retry=self._resend_retry)
+        
+        return _parse_json(response)
     
     def get_document_result(self, document_id: str) -> Dict[str, Any]:
         """
         Retrieve the processing result for a previously submitted document.
         
+        While a document is still processing, the previous response's ETag
+        is sent as If-None-Match, so an unchanged result costs an empty
+        304 response instead of the full body. 429/502/503/504 responses
+        are retried automatically, honouring Retry-After.
+        
         Args:
             document_id (str): The unique document ID returned from process_document
         
@@ -163,31 +491,267 @@ class EkaCareSDK:
             >>> if result["status"] == "completed":
             >>>     print(result["data"]["fhir"])
         """
-        url = self.base_url + self.RESULT_ENDPOINT.format(document_id=document_id)
+        return self._get_result(document_id, retry=self._resend_retry)
+    
+    def _get_result(self, document_id: str, retry: Optional[Retry] = None) -> Dict[str, Any]:
+        """get_document_result(), re-sending on 429/5xx only if given a retry policy.
         
-        response = self._session.get(url)
-        response.raise_for_status()
+        The polling loops call this without one, so they back off on 429/5xx
+        themselves and never sleep past their deadline.
+        """
+        url = self._result_url_tmpl.format(document_id)
+        cached = self._result_etags.get(document_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self._send(
+            lambda: self._session.get(url, headers=headers, timeout=self.timeout),
+            retry=retry
+        )
+        if response.status_code == 304 and cached:
+            # Hand out a copy so callers can't alter the cached body
+            return copy.deepcopy(cached[1])
+        
+        result = _parse_json(response)
+        
+        # Only in-progress results get polled again; don't hold on to
+        # finished or failed (and typically large) payloads
+        self._forget_result(document_id)
+        etag = response.headers.get("ETag")
+        if etag and not _is_complete(result) and result.get("status") != "failed":
+            self._result_etags[document_id] = (etag, copy.deepcopy(result))
+            # Bound the cache for documents that are never polled again
+            while len(self._result_etags) > ETAG_CACHE_SIZE:
+                self._forget_result(next(iter(self._result_etags)))
+        
+        return result
+    
+    def _forget_result(self, document_id: str) -> None:
+        """Drop a document's cached ETag and in-progress result."""
+        self._result_etags.pop(document_id, None)
+    
+    def get_document_results(self, document_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve the processing results for several documents in one request.
+        
+        With bulk_results=True, this first tries the bulk results endpoint,
+        which answers with an object keyed by document ID. If the API rejects
+        that request (any 4xx other than 429) or answers with anything but
+        such an object, this falls back to one get_document_result call per
+        document from then on; otherwise (and by default) it always polls
+        the documents one by one. Like get_document_result(), it retries
+        429/502/503/504 responses automatically.
+        
+        Args:
+            document_ids (list): Document IDs returned from process_document
+        
+        Returns:
+            dict: Processing results keyed by document ID
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+            
+        Example:
+            >>> results = sdk.get_document_results(["doc_1", "doc_2"])
+            >>> print(results["doc_1"]["status"])
+        """
+        return self._get_results(document_ids, retry=self._resend_retry)
+    
+    def _get_results(
+        self,
+        document_ids: List[str],
+        retry: Optional[Retry] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """get_document_results(), re-sending on 429/5xx only if given a retry policy."""
+        if self._bulk_results_supported:
+            results = self._get_bulk_results(document_ids, retry)
+            if results is not None:
+                return results
+        
+        return {
+            document_id: self._get_result(document_id, retry)
+            for document_id in document_ids
+        }
+    
+    def _get_bulk_results(
+        self,
+        document_ids: List[str],
+        retry: Optional[Retry] = None
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Query the bulk results endpoint; None means "poll one by one"."""
+        params = [("id", document_id) for document_id in document_ids]
+        
+        # No re-login on 401: here it's as likely to mean "not for this
+        # client" as an expired token, and the per-document fallback
+        # re-authenticates if it really was the token
+        try:
+            response = self._send(
+                lambda: self._session.get(
+                    self._results_url, params=params, timeout=self.timeout
+                ),
+                retry=retry,
+                reauthenticate=False
+            )
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code == 401:
+                return None
+            if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                self._bulk_results_supported = False
+                return None
+            raise
+        
+        try:
+            results = _parse_json(response)
+        except requests.exceptions.InvalidJSONError:
+            results = None
+        if not (
+            isinstance(results, dict)
+            and all(isinstance(result, dict) for result in results.values())
+        ):
+            self._bulk_results_supported = False
+            return None
+        return results
+    
+    def _callback_event(self, document_id: str) -> threading.Event:
+        """Register (or get) the completion event for a document being waited on."""
+        with self._callback_lock:
+            event = self._callback_events.get(document_id)
+            if event is None:
+                event = self._callback_events[document_id] = threading.Event()
+            return event
+    
+    def _release_callback(self, document_id: str) -> None:
+        """Forget a document's completion event once nobody is waiting on it."""
+        with self._callback_lock:
+            self._callback_events.pop(document_id, None)
+    
+    def _notify_document(self, document_id: str) -> None:
+        """Wake the waiter for a document; called by the callback server.
+        
+        Callbacks for documents nobody is waiting on are ignored, so stray
+        or forged requests can't grow the event registry.
+        """
+        with self._callback_lock:
+            event = self._callback_events.get(document_id)
+        if event is not None:
+            event.set()
+    
+    def serve_callbacks(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Start a background HTTP server that receives completion callbacks.
+        
+        The server accepts POSTed JSON bodies of the form
+        {"document_id": ..., "status": ...} and wakes any thread blocked in
+        wait_for_document() or process_and_wait() for that document. Pass
+        the server's public URL as callback_url when submitting documents.
+        The server is shut down by close().
+        
+        A callback only triggers an immediate poll: the result is always
+        fetched from the API and checked before it is returned, so an
+        unauthenticated or premature callback can't produce an unfinished
+        result.
+        
+        Args:
+            port (int): Port to listen on (0 picks a free port)
+            host (str): Interface to bind (default: 127.0.0.1; put a reverse
+                proxy in front, or pass "0.0.0.0" to listen on all interfaces)
+        
+        Returns:
+            ThreadingHTTPServer: The running server
+            
+        Example:
+            >>> sdk.serve_callbacks(8080)
+            >>> sdk.process_and_wait("report.jpg", callback_url="https://example.com/eka-callback")
+        """
+        sdk = self
         
-        return response.json()
+        class CallbackHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    if not 0 <= length <= MAX_CALLBACK_BODY:
+                        raise ValueError("callback body too large")
+                    payload = json.loads(self.rfile.read(length))
+                    document_id = payload["document_id"]
+                except (ValueError, KeyError, TypeError):
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                sdk._notify_document(str(document_id))
+                self.send_response(204)
+                self.end_headers()
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer((host, port), CallbackHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._callback_server = server
+        return server
+    
+    def wait_for_document(
+        self,
+        document_id: str,
+        event: Optional[threading.Event] = None,
+        timeout: Optional[float] = None,
+        poll_interval: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Wait for a document to finish, waking early on its completion event.
+        
+        The document is polled with the same backoff as process_and_wait();
+        setting the event (normally done by the serve_callbacks() server)
+        cuts the current sleep short, so a callback is picked up at once
+        and a lost callback only costs a regular poll.
+        
+        Args:
+            document_id (str): The document ID returned from process_document
+            event (threading.Event, optional): Event to wait on; defaults to
+                the one set by the serve_callbacks() server for this document
+            timeout (float, optional): Maximum seconds to wait (default: forever)
+            poll_interval (int): Base seconds between polling attempts (default: 10)
+        
+        Returns:
+            dict: The completed processing result
+            
+        Raises:
+            TimeoutError: If processing doesn't complete within timeout
+            requests.exceptions.RequestException: If the API request fails
+        """
+        registered = event is None
+        if registered:
+            event = self._callback_event(document_id)
+        try:
+            return self._poll_until_done(document_id, poll_interval, timeout, event)
+        finally:
+            if registered:
+                self._release_callback(document_id)
     
     def process_and_wait(
         self,
         file_path: str,
         task: Literal["smart", "pii", "both"] = "smart",
         poll_interval: int = 10,
-        timeout: int = 300
+        timeout: int = 300,
+        callback_url: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a document and wait for completion.
         
         This is a convenience method that combines process_document and polling
-        for results in a single call.
+        for results in a single call. If callback_url is given (and
+        serve_callbacks() is running behind it), the completion callback
+        wakes the polling loop early; see wait_for_document().
         
         Args:
             file_path (str): Path to the file to upload
             task (str): Processing task - one of "smart", "pii", or "both"
-            poll_interval (int): Seconds to wait between polling attempts (default: 10)
+            poll_interval (int): Base seconds between polling attempts (default: 10).
+                Polling starts at 1 second and backs off exponentially, with
+                jitter, up to 3x this value.
             timeout (int): Maximum seconds to wait for completion (default: 300)
+            callback_url (str, optional): URL the API should notify on completion
         
         Returns:
             dict: The completed processing result
@@ -202,34 +766,194 @@ class EkaCareSDK:
             >>> print(result["data"]["output"])
         """
         # Submit document
-        submit_result = self.process_document(file_path, task=task)
+        submit_result = self.process_document(
+            file_path, task=task, callback_url=callback_url
+        )
         document_id = submit_result["document_id"]
         
-        # Poll for results
+        if callback_url:
+            return self.wait_for_document(
+                document_id, timeout=timeout, poll_interval=poll_interval
+            )
+        return self._poll_until_done(document_id, poll_interval, timeout)
+    
+    def _poll_until_done(
+        self,
+        document_id: str,
+        poll_interval: float,
+        timeout: Optional[float],
+        event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """Poll a submitted document with backoff until it completes.
+        
+        If event is given, setting it ends the current sleep early.
+        """
+        backoff = _PollBackoff(poll_interval)
         start_time = time.time()
-        while True:
-            # Check timeout
-            if time.time() - start_time > timeout:
-                raise TimeoutError(
-                    f"Document processing timed out after {timeout} seconds"
-                )
-            
-            result = self.get_document_result(document_id)
-            data = result.get("data", {})
-            
-            # Check if processing is complete
-            if data.get("fhir") and data.get("output"):
-                return result
+        try:
+            while True:
+                # Check timeout
+                elapsed = time.time() - start_time
+                if timeout is not None and elapsed > timeout:
+                    raise TimeoutError(
+                        f"Document processing timed out after {timeout} seconds"
+                    )
+                
+                try:
+                    result = self._get_result(document_id)
+                except requests.exceptions.HTTPError as e:
+                    if not _is_retryable(e):
+                        raise
+                    backoff.throttle(e.response.headers.get("Retry-After"))
+                else:
+                    # Check if processing is complete
+                    if _is_complete(result):
+                        return result
+                
+                    # Check if processing failed
+                    if result.get("status") == "failed":
+                        raise Exception("Document processing failed")
+                
+                # Wait before next poll, without overshooting the timeout
+                delay = backoff.next_sleep()
+                if timeout is not None:
+                    delay = min(delay, max(timeout - elapsed, 0))
+                if event is None:
+                    time.sleep(delay)
+                elif event.wait(delay):
+                    event.clear()
+        finally:
+            # Timed out, failed or abandoned: nothing will revalidate it
+            self._forget_result(document_id)
+    
+    def process_documents(
+        self,
+        file_paths: Iterable[str],
+        doc_type: Literal["lr"] = "lr",
+        task: Literal["smart", "pii", "both"] = "smart",
+        max_concurrency: int = 8,
+        poll_interval: int = 10,
+        timeout: int = 300
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Process several documents and yield each result as it completes.
+        
+        Documents are uploaded concurrently, then all outstanding documents
+        are polled together with one get_document_results call and one
+        sleep per round, instead of one polling loop per document.
+        
+        If some uploads fail, the documents that were accepted are still
+        polled and yielded; the first failed upload's exception (in
+        file_paths order) is raised only after that, so no accepted
+        document is lost.
+        
+        Args:
+            file_paths: Paths of the files to upload
+            doc_type (str): Document type (default: "lr" for lab report)
+            task (str): Processing task - one of "smart", "pii", or "both"
+            max_concurrency (int): Maximum simultaneous uploads (default: 8)
+            poll_interval (int): Base seconds between polling rounds (default: 10)
+            timeout (int): Maximum seconds to wait for all documents (default: 300)
+        
+        Yields:
+            tuple: (file_path, result) for each completed document, in
+            completion order
             
-            # Check if processing failed
-            if result.get("status") == "failed":
-                raise Exception("Document processing failed")
+        Raises:
+            TimeoutError: If any document doesn't complete within timeout
+            FileNotFoundError: If a file doesn't exist (after the other
+                documents are yielded)
+            requests.exceptions.RequestException: If any API request fails
             
-            # Wait before next poll
-            time.sleep(poll_interval)
+        Example:
+            >>> for path, result in sdk.process_documents(["a.jpg", "b.jpg"]):
+            >>>     print(path, result["data"]["output"])
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+        
+        # Submit all documents, keeping the ones accepted even if others fail
+        submitted = {}
+        upload_errors = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(
+                    self.process_document, file_path, doc_type=doc_type, task=task
+                ): file_path
+                for file_path in file_paths
+            }
+            for future in as_completed(futures):
+                try:
+                    submitted[future.result()["document_id"]] = futures[future]
+                except Exception as e:
+                    upload_errors[futures[future]] = e
+        
+        # Poll all outstanding documents, one sleep per round
+        for document_id, result in self._poll_documents(submitted, poll_interval, timeout):
+            if not _is_complete(result):
+                raise Exception(f"Document processing failed: {submitted[document_id]}")
+            yield submitted[document_id], result
+        
+        # Only now report uploads that failed
+        for file_path in file_paths:
+            if file_path in upload_errors:
+                raise upload_errors[file_path]
+    
+    def _poll_documents(
+        self,
+        document_ids: Iterable[str],
+        poll_interval: float,
+        timeout: float
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Poll submitted documents together until each completes or fails.
+        
+        Yields (document_id, result) once per document, as soon as its result
+        is complete or its status is "failed"; raises TimeoutError if any
+        are still processing after timeout seconds.
+        """
+        pending = set(document_ids)
+        backoff = _PollBackoff(poll_interval)
+        start_time = time.time()
+        try:
+            while pending:
+                # Check timeout
+                elapsed = time.time() - start_time
+                if elapsed > timeout:
+                    raise TimeoutError(
+                        f"{len(pending)} document(s) still processing after {timeout} seconds"
+                    )
+                
+                try:
+                    results = self._get_results(list(pending))
+                except requests.exceptions.HTTPError as e:
+                    if not _is_retryable(e):
+                        raise
+                    backoff.throttle(e.response.headers.get("Retry-After"))
+                    results = {}
+                
+                for document_id, result in results.items():
+                    if document_id not in pending:
+                        continue
+                    
+                    # Finished, one way or the other
+                    if _is_complete(result) or result.get("status") == "failed":
+                        pending.discard(document_id)
+                        yield document_id, result
+                
+                # Wait before next round, without overshooting the timeout
+                if pending:
+                    time.sleep(min(backoff.next_sleep(), max(timeout - elapsed, 0)))
+        finally:
+            # Don't keep ETags for documents nobody will poll again
+            for document_id in pending:
+                self._forget_result(document_id)
     
     def close(self) -> None:
-        """Close the underlying session."""
+        """Close the underlying session and any callback server."""
+        if self._callback_server is not None:
+            self._callback_server.shutdown()
+            self._callback_server.server_close()
+            self._callback_server = None
         self._session.close()
     
     def __enter__(self):
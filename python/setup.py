@@ -36,6 +36,8 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.28.0",
+        "requests-toolbelt>=0.10.0",
+        "urllib3>=1.26.0",
     ],
     extras_require={
         "dev": [
@@ -48,7 +50,13 @@ setup(
         ],
         "cli": [
             "rich>=13.0.0",  # For better CLI output
-        ]
+        ],
+        "async": [
+            "aiohttp>=3.8.0",  # For AsyncEkaCareSDK
+        ],
+        "speedups": [
+            "orjson>=3.6.0",  # Faster JSON parsing of large results
+        ],
     },
     entry_points={
         "console_scripts": [
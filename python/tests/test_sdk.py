@@ -0,0 +1,130 @@
+"""
+Tests for EkaCareSDK._send(): re-sending on transient statuses and 401s.
+
+The SDK is built with authentication stubbed out, and each test hands
+_send() a callable that returns canned responses, so no network is used.
+"""
+
+import io
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+from urllib3.util.retry import Retry
+
+from ekacare_sdk.sdk import EkaCareSDK, RETRY_TOTAL, _retry_policy
+
+
+BASE_URL = "https://api.example.com"
+UPLOAD_URL = BASE_URL + EkaCareSDK.PROCESS_ENDPOINT
+
+
+@pytest.fixture
+def auth_calls(monkeypatch):
+    """Stub out authentication, recording the force flag of each call."""
+    calls = []
+    monkeypatch.setattr(
+        EkaCareSDK, "_authenticate", lambda self, force=False: calls.append(force)
+    )
+    return calls
+
+
+@pytest.fixture
+def sdk(auth_calls):
+    sdk = EkaCareSDK("client-id", "client-secret", base_url=BASE_URL, cache_token=False)
+    yield sdk
+    sdk.close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Skip urllib3's backoff sleeps, counting them instead."""
+    calls = []
+    monkeypatch.setattr(Retry, "sleep", lambda self, response=None: calls.append(response))
+    return calls
+
+
+def make_response(status: int) -> requests.Response:
+    """Build a requests.Response backed by a urllib3 response, as the adapter would."""
+    response = requests.Response()
+    response.status_code = status
+    response.url = UPLOAD_URL
+    response.request = requests.Request("POST", UPLOAD_URL).prepare()
+    response.raw = HTTPResponse(
+        body=io.BytesIO(b"{}"), status=status, preload_content=False
+    )
+    return response
+
+
+def make_sender(*statuses: int):
+    """Return a send() callable answering with statuses in turn, and its call log."""
+    calls = []
+
+    def send() -> requests.Response:
+        response = make_response(statuses[len(calls)])
+        calls.append(response.status_code)
+        return response
+
+    return send, calls
+
+
+def test_send_retries_transient_statuses(sdk, sleeps):
+    send, calls = make_sender(503, 429, 200)
+
+    response = sdk._send(send, retry=_retry_policy())
+
+    assert response.status_code == 200
+    assert calls == [503, 429, 200]
+    assert len(sleeps) == 2
+
+
+def test_send_gives_up_after_retry_total(sdk, sleeps):
+    send, calls = make_sender(*[503] * (RETRY_TOTAL + 1))
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        sdk._send(send, retry=_retry_policy())
+
+    assert excinfo.value.response.status_code == 503
+    assert len(calls) == RETRY_TOTAL + 1
+    assert len(sleeps) == RETRY_TOTAL
+
+
+def test_send_does_not_retry_client_errors(sdk, sleeps):
+    send, calls = make_sender(400)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        sdk._send(send, retry=_retry_policy())
+
+    assert calls == [400]
+    assert sleeps == []
+
+
+def test_send_does_not_resend_upload_on_500(sdk, sleeps):
+    # The document may already exist; re-sending would create a duplicate
+    send, calls = make_sender(500, 200)
+
+    with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+        sdk._send(send, retry=sdk._resend_retry)
+
+    assert excinfo.value.response.status_code == 500
+    assert calls == [500]
+    assert sleeps == []
+
+
+def test_send_without_retry_policy_sends_once(sdk, sleeps):
+    send, calls = make_sender(503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        sdk._send(send)
+
+    assert calls == [503]
+
+
+def test_send_reauthenticates_once_on_401(sdk, auth_calls, sleeps):
+    send, calls = make_sender(401, 200)
+
+    response = sdk._send(send, retry=_retry_policy())
+
+    assert response.status_code == 200
+    assert calls == [401, 200]
+    assert auth_calls == [False, True]
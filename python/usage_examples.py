@@ -1,23 +1,19 @@
 """
 Example usage scripts for Eka Care SDK.
+
+The examples share one EkaCareSDK instance, so authentication happens once
+and the HTTP session is closed when the `with` block exits.
 """
 
-import time
 from ekacare_sdk import EkaCareSDK
 
 
-def example_basic_usage(client_id: str, client_secret: str, file_path: str):
+def example_basic_usage(sdk: EkaCareSDK, file_path: str):
     """Basic usage example."""
     print("="*60)
     print("Example 1: Basic Document Processing")
     print("="*60)
     
-    # Initialize SDK
-    sdk = EkaCareSDK(
-        client_id=client_id,
-        client_secret=client_secret,
-    )
-    
     # Process a document
     result = sdk.process_document(
         file_path,
@@ -28,39 +24,21 @@ def example_basic_usage(client_id: str, client_secret: str, file_path: str):
     print(f"Status: {result.get('status', 'unknown')}")
 
 
-def example_with_polling(client_id: str, client_secret: str, file_path: str):
+def example_with_polling(sdk: EkaCareSDK, file_path: str):
     """Example with polling for results."""
     print("\n" + "="*60)
     print("Example 2: Process and Wait for Results")
     print("="*60)
     
-    sdk = EkaCareSDK(
-        client_id=client_id,
-        client_secret=client_secret,
-    )
-    
-    # Submit document
-    result = sdk.process_document(file_path, task="smart")
-    document_id = result["document_id"]
+    print("Submitting document and polling for results...\n")
     
-    print(f"Document submitted: {document_id}")
-    print("Polling for results...\n")
+    # Submit the document and poll (with backoff) until it's done
+    response = sdk.process_and_wait(file_path, task="smart")
+    data = response["data"]
     
-    # Poll for results
-    while True:
-        response = sdk.get_document_result(document_id)
-        data = response.get("data", {})
-        
-        if data.get("fhir") and data.get("output"):
-            print("✓ Processing completed!")
-            print(f"\nFHIR data: {data['fhir']}")
-            print(f"Output data: {data['output']}")
-            break
-        
-        print("Still processing...", end="\r")
-        time.sleep(10)
-    
-    sdk.close()
+    print("✓ Processing completed!")
+    print(f"\nFHIR data: {data['fhir']}")
+    print(f"Output data: {data['output']}")
 
 
 if __name__ == "__main__":
@@ -68,13 +46,18 @@ if __name__ == "__main__":
     print("These are example snippets. Update credentials and file paths before running.\n")
     
     import argparse
-
+    
     parser = argparse.ArgumentParser(description="Eka Care SDK Example")
     parser.add_argument("--client-id", required=True, help="Client ID for authentication")
     parser.add_argument("--client-secret", required=True, help="Client secret for authentication")
     parser.add_argument("--file", required=True, help="file path")
     args = parser.parse_args()
-
-    # Uncomment the example you want to run:
-    # example_basic_usage(args.client_id, args.client_secret, args.file)
-    example_with_polling(args.client_id, args.client_secret, args.file)
+    
+    # One authenticated SDK instance for every example
+    with EkaCareSDK(
+        client_id=args.client_id,
+        client_secret=args.client_secret,
+    ) as sdk:
+        # Uncomment the example you want to run:
+        # example_basic_usage(sdk, args.file)
+        example_with_polling(sdk, args.file)